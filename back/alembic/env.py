@@ -1,5 +1,7 @@
 import importlib
+import json
 import logging
+import os
 from pathlib import Path
 from logging.config import fileConfig
 
@@ -11,33 +13,122 @@ from alembic import context
 
 from sqlmodel import SQLModel
 
+from template_app.core import config as app_config
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
 
+# Discovered models modules, reused as long as no directory under src/ changed
+MODELS_INDEX_PATH = Path(__file__).parent / "__pycache__" / "models_index.json"
+
+# Directories that never contain models and can be large (virtualenvs, ...)
+_PRUNED_DIRS = frozenset({"__pycache__", "node_modules", "build", "dist"})
+
+
+def _iter_models(root: str, dir_mtimes: dict[str, int]):
+    """Yield the dotted module name of every models.py found under root.
+
+    The mtime of every visited directory is recorded in dir_mtimes: adding or
+    removing a models.py file (or a package) changes the mtime of its parent.
+    """
+    try:
+        dir_mtimes[root] = os.stat(root).st_mtime_ns
+    except OSError:
+        # e.g. the runtime image, where the package is not under src/
+        return
+    stack = [root]
+    while stack:
+        # Like os.walk: skip directories that vanished or cannot be read
+        try:
+            scandir_it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with scandir_it as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in _PRUNED_DIRS or entry.name.startswith("."):
+                        continue
+                    try:
+                        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                    dir_mtimes[entry.path] = mtime
+                    stack.append(entry.path)
+                elif entry.name == "models.py":
+                    rel = entry.path[len(root) + 1 : -len(".py")]
+                    yield rel.replace(os.sep, ".")
+
+
+def _load_models_index(root: str) -> list[str] | None:
+    try:
+        with open(MODELS_INDEX_PATH) as f:
+            index = json.load(f)
+        if index["root"] != root:
+            return None
+        for path, mtime in index["dirs"].items():
+            if os.stat(path).st_mtime_ns != mtime:
+                return None
+        return index["modules"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_models_index(root: str, modules: list[str], dir_mtimes: dict[str, int]):
+    index = {"root": root, "dirs": dir_mtimes, "modules": modules}
+    # Write to a private file then rename: concurrent alembic runs never see a
+    # partially written index and the last writer wins.
+    tmp_path = f"{MODELS_INDEX_PATH}.{os.getpid()}"
+    try:
+        MODELS_INDEX_PATH.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, MODELS_INDEX_PATH)
+    except OSError:
+        # e.g. read-only filesystem in a container: the cache is optional
+        logger.debug("Could not write models index", exc_info=True)
+
+
+def _discover_models(root: str) -> list[str]:
+    modules = _load_models_index(root)
+    if modules is None:
+        dir_mtimes: dict[str, int] = {}
+        modules = list(_iter_models(root, dir_mtimes))
+        # Nothing to key the index on when the root does not exist
+        if root in dir_mtimes:
+            _save_models_index(root, modules, dir_mtimes)
+    return modules
+
+
 def import_models():
     """Walk through the src folder to find models.py files.
 
     In our convention, this is where you place your SQLModel definitions.
     """
-    root_path = (Path(__file__).parent.parent / "src").resolve()
+    # env.py is executed again by every alembic command run in the same
+    # process (see template_app.commands.init_db): discover models only once.
+    # Checking for SQLModel.metadata.tables would not do, the application may
+    # have imported only some of the models.
+    if SQLModel.metadata.info.get("all_models_imported"):
+        return
+
+    root_path = str((Path(__file__).parent.parent / "src").resolve())
 
     imported = set()
 
-    for path, dirnames, filenames in root_path.walk():
-        # If this directory contains a db.py file, import it as a module.
-        if "models.py" in filenames:
-            file_path = path / "models.py"
-            module = ".".join(file_path.relative_to(root_path).with_suffix("").parts)
-            if module and module not in imported:
-                importlib.import_module(module)
-                imported.add(module)
+    # Shallowest modules first: their parent packages are then already in
+    # sys.modules when the deeper ones get imported.
+    for module in sorted(_discover_models(root_path), key=lambda m: m.count(".")):
+        if module and module not in imported:
+            importlib.import_module(module)
+            imported.add(module)
     if not imported:
         logger.warning("No models.py found, no migration could be generated")
     else:
         imported_models = "\n".join(sorted(imported))
         logger.info(f"The following models were imported:\n{imported_models}")
+    SQLModel.metadata.info["all_models_imported"] = True
 
 
 import_models()
@@ -49,7 +140,10 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when alembic is run in-process (see template_app.commands.init_db).
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -65,13 +159,8 @@ target_metadata = SQLModel.metadata
 
 
 def get_url():
-    import os
-
-    db_url = os.getenv("POSTGRESQL_URL")
-    assert db_url, "Please specify POSTGRESQL_URL env var"
-    if db_url.startswith("postgresql://"):
-        return "postgresql+psycopg://" + db_url[len("postgresql://") :]
-    return db_url
+    # Set when migrations are run from template_app.commands.init_db
+    return config.get_main_option("sqlalchemy.url") or app_config.POSTGRESQL_URL_PSYCOPG
 
 
 def run_migrations_offline() -> None:
@@ -1,19 +1,20 @@
 """Script to initialize and set up PostgreSQL instance for SQLModel tables."""
 
 import logging
-import os
-import subprocess
 import sys
-import traceback
+from functools import lru_cache
 from pathlib import Path
-
-import psycopg.errors
-import sqlalchemy
-from sqlalchemy import NullPool, create_engine, text
-from sqlalchemy.exc import ProgrammingError
+from typing import TYPE_CHECKING
 
 from template_app.core import config
 
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+# psycopg, sqlalchemy, alembic and concurrent.futures are imported in the
+# functions using them to keep the command start-up (and modules importing it)
+# cheap.
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,13 +22,18 @@ class DBInitError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
 def get_alembic_config_dir() -> Path:
-    """Get the directory containing alembic.ini."""
+    """Get the directory containing alembic.ini.
+
+    The result is cached for the lifetime of the process, call
+    ``get_alembic_config_dir.cache_clear()`` if the working directory changes.
+    """
     # Try to find alembic.ini in multiple possible locations
     # to support both local development and container environments
 
-    # Local development: back/ directory (4 levels up from this file)
-    local_dev_path = Path(__file__).parent.parent.parent.parent
+    # Local development: back/ directory
+    local_dev_path = config.PROJECT_ROOT_DIR
 
     # Container environment: alembic files should be at /app level
     container_path = Path("/app")
@@ -45,22 +51,46 @@ def get_alembic_config_dir() -> Path:
     return local_dev_path
 
 
+def get_alembic_config(db_uri: str) -> "Config":
+    """Build an Alembic config to run commands in-process against db_uri."""
+    from alembic.config import Config
+
+    alembic_dir = get_alembic_config_dir()
+    alembic_cfg = Config(str(alembic_dir / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(alembic_dir / "alembic"))
+    # configparser interpolation: a literal % must be doubled
+    alembic_cfg.set_main_option("sqlalchemy.url", db_uri.replace("%", "%%"))
+    # Keep the application logging setup untouched
+    alembic_cfg.attributes["configure_logger"] = False
+    return alembic_cfg
+
+
 def create_database_if_not_exists(postgres_db_uri: str, database_name: str):
+    return create_databases_if_not_exist(postgres_db_uri, [database_name])
+
+
+def create_databases_if_not_exist(postgres_db_uri: str, database_names: list[str]):
+    """Create the missing databases, reusing a single maintenance connection."""
+    import psycopg.errors
+    from sqlalchemy import NullPool, create_engine, text
+    from sqlalchemy.exc import ProgrammingError
+
     engine = create_engine(postgres_db_uri, poolclass=NullPool)
     try:
         with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
-            try:
-                conn.execute(text(f'CREATE DATABASE "{database_name}"'))
-            except ProgrammingError as e:
-                if isinstance(e.orig, psycopg.errors.DuplicateDatabase):
-                    logger.info(f"{database_name} already exists")
-                else:
+            for database_name in database_names:
+                try:
+                    conn.execute(text(f'CREATE DATABASE "{database_name}"'))
+                except ProgrammingError as e:
+                    if isinstance(e.orig, psycopg.errors.DuplicateDatabase):
+                        logger.info(f"{database_name} already exists")
+                        continue
+                    logger.error(f"❌ failed to create database {database_name}")
+                    raise
+                except Exception:
                     logger.error(f"❌ failed to create database {database_name}")
                     raise
-            except Exception:
-                logger.error(f"❌ failed to create database {database_name}")
-                raise
-        logger.info(f"Created database {database_name}")
+                logger.info(f"Created database {database_name}")
     except Exception:
         return False
     finally:
@@ -70,44 +100,70 @@ def create_database_if_not_exists(postgres_db_uri: str, database_name: str):
 
 def run_migrations(db_uri: str) -> bool:
     """Set up the PostgreSQL database using Alembic migrations."""
+    import alembic.command
+
     try:
         # Setup SQLModel tables using Alembic migrations
         logger.info("Setting up SQLModel tables using Alembic migrations...")
-        alembic_dir = get_alembic_config_dir()
 
         # Run Alembic migrations to create/update database schema
         logger.info("Running Alembic migrations...")
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            cwd=alembic_dir,
-            capture_output=True,
-            text=True,
-            env={**os.environ, "POSTGRESQL_URL": db_uri},
-        )
-
-        if result.returncode != 0:
-            logger.error(f"❌ Failed to run Alembic migrations:\n{result.stderr}")
+        alembic_cfg = get_alembic_config(db_uri)
+        try:
+            alembic.command.upgrade(alembic_cfg, "head")
+        except Exception:
+            # Keep the traceback: it is all there is to debug a failed migration
+            logger.exception("❌ Failed to run Alembic migrations")
             return False
-        else:
-            logger.info(result.stdout)
 
         logger.info("✅ Database setup completed successfully")
         return True
     except Exception as e:
+        import traceback
+
         logger.error(f"❌ Failed to set up database: {e}")
         traceback.print_exc()
         return False
 
 
+def run_migrations_parallel(
+    db_uris: list[str], workers: int = 6, batch: int = 50
+) -> bool:
+    """Run Alembic migrations on several independent databases concurrently.
+
+    Databases are submitted to the worker pool by batches of ``batch`` URIs so
+    that a large tenant list does not get queued all at once.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from sqlalchemy.engine import make_url
+
+    failed: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(db_uris), batch):
+            uris = db_uris[start : start + batch]
+            for db_uri, success in zip(
+                uris, executor.map(run_migrations, uris), strict=True
+            ):
+                if not success:
+                    failed.append(db_uri)
+
+    if failed:
+        names = ", ".join(str(make_url(uri).database) for uri in failed)
+        logger.error(f"❌ Migrations failed for {len(failed)} database(s): {names}")
+        return False
+    return True
+
+
 def init_db():
     """Initialize PostgreSQL database for the template application."""
+    from sqlalchemy.engine import make_url
+
     logger.info("🚀 Starting PostgreSQL initialization...")
 
-    db_url_string = config.POSTGRESQL_URL
-    if db_url_string.startswith("postgresql://"):
-        db_url_string = "postgresql+psycopg://" + db_url_string[len("postgresql://") :]
+    db_url_string = config.POSTGRESQL_URL_PSYCOPG
 
-    db_url = sqlalchemy.engine.url.make_url(db_url_string)
+    db_url = make_url(db_url_string)
     if not db_url.database:
         raise DBInitError("⚠️ Could not setup database: no target database found")
 
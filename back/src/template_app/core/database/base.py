@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
@@ -7,18 +8,23 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from template_app.core import config
 
+# Pool sizes for development (adjust for production)
+POOL_SIZE = 5 if config.ENV == "dev" else 2
+MAX_OVERFLOW = 10 if config.ENV == "dev" else 2
+
 # Database engine configuration
 engine = create_async_engine(
-    config.POSTGRESQL_URL.replace("postgresql:", "postgresql+asyncpg:"),
-    # Pool sizes for development (adjust for production)
-    pool_size=5 if config.ENV == "dev" else 2,
-    max_overflow=10 if config.ENV == "dev" else 2,
+    config.POSTGRESQL_URL_ASYNCPG,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_timeout=60,  # Increase timeout from default 30s
     pool_recycle=3600,  # Recycle connections every hour
     # Async-specific settings
     echo=config.DEBUG,
     future=True,
+    # Per-connection cache of asyncpg prepared statements (default is 100)
+    connect_args={"prepared_statement_cache_size": 512},
 )
 
 SESSION_OPTIONS = dict(
@@ -29,22 +35,46 @@ SESSION_OPTIONS = dict(
 
 SessionLocal = async_sessionmaker(engine, **SESSION_OPTIONS)  # type: ignore
 
+# Sessions recycled between read-only requests, one per possible connection.
+# Only enabled between init_db_connections() and close_db_connections().
+SESSION_POOL_SIZE = POOL_SIZE + MAX_OVERFLOW
+_session_pool: asyncio.Queue[AsyncSession] | None = None
+
+
+def _checkout_read_session() -> AsyncSession:
+    if _session_pool is not None:
+        try:
+            return _session_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    return SessionLocal()
+
+
+def _checkin_read_session(session: AsyncSession) -> None:
+    if _session_pool is not None:
+        try:
+            _session_pool.put_nowait(session)
+        except asyncio.QueueFull:
+            pass
+
 
 async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Get a database session for FastAPI dependency injection."""
-    async with SessionLocal() as session:
-        if request.method in {"POST", "PUT", "PATCH", "DELETE"}:
+    if request.method in {"POST", "PUT", "PATCH", "DELETE"}:
+        async with SessionLocal() as session:
             # Whole request wrapped in one transaction (like django ATOMIC_REQUESTS)
             async with session.begin():
                 # In case of error the context manager will rollback as needed
                 yield session
-        else:
-            try:
-                yield session
-            finally:
-                if session.in_transaction():
-                    # Rollback any existing transaction (should not happen)
-                    await session.rollback()
+    else:
+        session = _checkout_read_session()
+        try:
+            yield session
+        finally:
+            # Rollback any existing transaction, release the connection and
+            # empty the identity map so that the session can be reused.
+            await session.close()
+            _checkin_read_session(session)
 
 
 @asynccontextmanager
@@ -57,11 +87,17 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db_connections():
     """Initialize database connections."""
-    pass  # Engine is created lazily
+    # Engine is created lazily, only the read session pool is filled here
+    global _session_pool
+    _session_pool = asyncio.Queue(maxsize=SESSION_POOL_SIZE)
+    for _ in range(SESSION_POOL_SIZE):
+        _session_pool.put_nowait(SessionLocal())
 
 
 async def close_db_connections():
     """Close database connections."""
+    global _session_pool
+    _session_pool = None
     await engine.dispose()
 
 
@@ -69,6 +105,9 @@ def now_factory():
     return datetime.now(UTC)
 
 
+# Escape backslash and SQL LIKE wildcards in a single pass
+_LIKE_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
 def escape_like(s: str) -> str:
-    # Escape backslash first, then SQL LIKE wildcards
-    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return s.translate(_LIKE_ESCAPE_TABLE)
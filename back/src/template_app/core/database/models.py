@@ -4,8 +4,6 @@ from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlmodel import Field, SQLModel
 
-from template_app.core.database.base import now_factory
-
 
 class Base(AsyncAttrs, SQLModel):
     pass
@@ -14,8 +12,9 @@ class Base(AsyncAttrs, SQLModel):
 class TimestampMixin(Base):
     """Mixin for adding timestamps to models."""
 
+    # Filled by the database on INSERT and fetched back with RETURNING
     created_at: datetime = Field(
-        default_factory=now_factory, sa_column_kwargs={"server_default": func.now()}
+        default=None, nullable=False, sa_column_kwargs={"server_default": func.now()}
     )
     updated_at: datetime | None = Field(
         default=None, sa_column_kwargs={"onupdate": func.now()}
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from template_app.core import config
 from template_app.core.database import close_db_connections, init_db_connections
@@ -40,11 +41,13 @@ def create_app() -> FastAPI:
         description="FastAPI template with domain-driven architecture",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=config.ALLOWED_ORIGINS,
+        # Starlette only does `origin in allow_origins`, a frozenset is fine
+        allow_origins=config.ALLOWED_ORIGINS,  # type: ignore[arg-type]
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
         allow_headers=["*"],
@@ -49,8 +49,10 @@ class Band(BaseModel, table=True):
     formed_year: int | None = None
     country: str | None = None
 
-    # Relationships
-    memberships: list[BandMembership] = Relationship(back_populates="band")
+    # Relationships (memberships are deleted by the database ON DELETE CASCADE)
+    memberships: list[BandMembership] = Relationship(
+        back_populates="band", cascade_delete=True, passive_deletes=True
+    )
 
 
 class Musician(BaseModel, table=True):
@@ -58,5 +60,7 @@ class Musician(BaseModel, table=True):
 
     name: str = Field(index=True)
 
-    # Relationships
-    memberships: list[BandMembership] = Relationship(back_populates="musician")
+    # Relationships (memberships are deleted by the database ON DELETE CASCADE)
+    memberships: list[BandMembership] = Relationship(
+        back_populates="musician", cascade_delete=True, passive_deletes=True
+    )
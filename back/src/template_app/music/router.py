@@ -28,7 +28,7 @@ async def create_band(
     music_service: MusicServiceDep,
 ):
     """Create a new band."""
-    return await music_service.create_band(band)
+    return schemas.band_to_schema(await music_service.create_band(band))
 
 
 @router.get("/bands", response_model=list[schemas.Band])
@@ -40,7 +40,7 @@ async def get_bands(
 ):
     """Get all bands with optional filtering by genre."""
     bands, _count = await music_service.get_bands(skip=skip, limit=limit, genre=genre)
-    return bands
+    return [schemas.band_to_schema(band) for band in bands]
 
 
 @router.get("/bands/{band_id}", response_model=schemas.Band)
@@ -49,7 +49,7 @@ async def get_band(
     music_service: MusicServiceDep,
 ):
     """Get a specific band by ID."""
-    return await music_service.get_band(band_id)
+    return schemas.band_to_schema(await music_service.get_band(band_id))
 
 
 @router.patch("/bands/{band_id}", response_model=schemas.Band)
@@ -59,7 +59,8 @@ async def update_band(
     music_service: MusicServiceDep,
 ):
     """Update a band."""
-    return await music_service.update_band(band_id, band_update)
+    band = await music_service.update_band(band_id, band_update)
+    return schemas.band_to_schema(band)
 
 
 @router.delete("/bands/{band_id}")
@@ -79,7 +80,7 @@ async def create_musician(
     music_service: MusicServiceDep,
 ):
     """Create a new musician."""
-    return await music_service.create_musician(musician)
+    return schemas.musician_to_schema(await music_service.create_musician(musician))
 
 
 @router.get("/musicians", response_model=list[schemas.Musician])
@@ -90,7 +91,10 @@ async def get_musicians(
     band_id: Annotated[int | None, Query()] = None,
 ):
     """Get all musicians with optional filtering by band."""
-    return await music_service.get_musicians(skip=skip, limit=limit, band_id=band_id)
+    musicians = await music_service.get_musicians(
+        skip=skip, limit=limit, band_id=band_id
+    )
+    return [schemas.musician_to_schema(musician) for musician in musicians]
 
 
 @router.get("/musicians/{musician_id}", response_model=schemas.Musician)
@@ -99,7 +103,8 @@ async def get_musician(
     music_service: MusicServiceDep,
 ):
     """Get a specific musician by ID."""
-    return await music_service.get_musician(musician_id)
+    musician = await music_service.get_musician(musician_id)
+    return schemas.musician_to_schema(musician)
 
 
 @router.patch("/musicians/{musician_id}", response_model=schemas.Musician)
@@ -109,7 +114,8 @@ async def update_musician(
     music_service: MusicServiceDep,
 ):
     """Update a musician."""
-    return await music_service.update_musician(musician_id, musician_update)
+    musician = await music_service.update_musician(musician_id, musician_update)
+    return schemas.musician_to_schema(musician)
 
 
 @router.delete("/musicians/{musician_id}")
@@ -1,6 +1,17 @@
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
-from template_app.music.models import MusicGenre, MusicInstrument
+from template_app.music import models
+
+# Literal mirrors of the model enums: pydantic-core validates them with a plain
+# string lookup instead of going through enum coercion
+MusicGenreLiteral = Literal[
+    "ROCK", "POP", "JAZZ", "BLUES", "FOLK", "ELECTRONIC", "HIP_HOP"
+]
+MusicInstrumentLiteral = Literal[
+    "GUITAR", "BASS", "DRUMS", "VOCALS", "KEYBOARD", "VIOLIN", "SAXOPHONE"
+]
 
 
 class MusicianBase(BaseModel):
@@ -22,7 +33,7 @@ class Musician(MusicianBase):
 
 
 class BandMembershipBase(BaseModel):
-    instrument: MusicInstrument
+    instrument: MusicInstrumentLiteral
 
 
 class BandMembershipCreate(BandMembershipBase):
@@ -38,7 +49,7 @@ class BandMembership(BandMembershipBase):
 
 class BandBase(BaseModel):
     name: str
-    genre: MusicGenre
+    genre: MusicGenreLiteral
     formed_year: int | None = None
     country: str | None = None
 
@@ -49,7 +60,7 @@ class BandCreate(BandBase):
 
 class BandUpdate(BaseModel):
     name: str | None = None
-    genre: str | None = None
+    genre: MusicGenreLiteral | None = None
     formed_year: int | None = None
     country: str | None = None
 
@@ -61,3 +72,28 @@ class Band(BandBase):
     )
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Database rows are already typed by their columns: build response schemas
+# with model_construct instead of re-validating them with from_attributes
+
+
+def musician_to_schema(musician: models.Musician) -> Musician:
+    return Musician.model_construct(id=musician.id, name=musician.name)
+
+
+def band_to_schema(band: models.Band) -> Band:
+    return Band.model_construct(
+        id=band.id,
+        name=band.name,
+        genre=band.genre,
+        formed_year=band.formed_year,
+        country=band.country,
+        memberships=[
+            BandMembership.model_construct(
+                instrument=membership.instrument,
+                musician=musician_to_schema(membership.musician),
+            )
+            for membership in band.memberships
+        ],
+    )
@@ -1,13 +1,30 @@
+from typing import Any
+
 from advanced_alchemy.exceptions import DuplicateKeyError
 from advanced_alchemy.filters import LimitOffset
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import delete, exists, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import col, select
 
 from template_app.core.exceptions import ConflictError, NotFoundError
 from template_app.music import schemas
 from template_app.music.models import Band, BandMembership, MusicGenre, Musician
 
+# Only load what the Band schema serializes: any other relationship access
+# raises instead of silently emitting a query
+BAND_LOAD_OPTIONS = [
+    selectinload(Band.memberships).joinedload(BandMembership.musician),  # type: ignore[arg-type]
+    raiseload("*"),
+]
+
+
+def _fields_set_values(data: PydanticBaseModel) -> dict[str, Any]:
+    """Values of the fields explicitly set on data, read without a model_dump()."""
+    return {field: getattr(data, field) for field in data.model_fields_set}
+
 
 class BandRepository(SQLAlchemyAsyncRepository[Band]):  # type: ignore
     model_type = Band
@@ -30,7 +47,9 @@ class MusicService:
 
     async def create_band(self, band_data: schemas.BandCreate) -> Band:
         """Create a new band."""
-        band = Band(**band_data.model_dump())
+        # Table models are not validated on init and the schema was validated
+        # by FastAPI: pass its fields as is instead of building a model_dump()
+        band = Band(**band_data.__dict__)
         try:
             await self.band_repository.add(band)
         except DuplicateKeyError as e:
@@ -42,7 +61,7 @@ class MusicService:
         """Get a band by ID with its musicians."""
         band = await self.band_repository.get_one_or_none(  # type: ignore[arg-type]
             id=band_id,
-            load=[Band.memberships],  # type: ignore[arg-type]
+            load=BAND_LOAD_OPTIONS,
         )
         if not band:
             raise NotFoundError(f"Band with ID {band_id} not found")
@@ -60,44 +79,49 @@ class MusicService:
             filters["genre"] = genre
         return await self.band_repository.list_and_count(
             LimitOffset(limit=limit, offset=skip),
-            load=[Band.memberships],  # type: ignore[arg-type]
+            load=BAND_LOAD_OPTIONS,
             **filters,  # type: ignore[arg-type]
         )
 
     async def update_band(self, band_id: int, band_data: schemas.BandUpdate) -> Band:
         """Update a band."""
-        band = await self.get_band(band_id=band_id)
-        if not band:
-            raise NotFoundError(f"Band with ID {band_id} not found")
+        # An empty PATCH is a plain read, no need to issue an UPDATE
+        if not band_data.model_fields_set:
+            return await self.get_band(band_id=band_id)
 
-        update_data = band_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(band, field, value)
+        values = _fields_set_values(band_data)
 
+        # Update and fetch the row back in a single UPDATE ... RETURNING
+        band = await self.session.scalar(
+            update(Band)
+            .where(col(Band.id) == band_id)
+            .values(**values)
+            .returning(Band),
+            # Refresh the instance if it is already in the identity map
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        if not band:
+            raise NotFoundError(f"Band with ID {band_id} not found")
+        await band.awaitable_attrs.memberships
         return band
 
     async def delete_band(self, band_id: int) -> None:
         """Delete a band and all its memberships."""
-        band = await self.band_repository.get_one_or_none(id=band_id)
-        if not band:
-            raise NotFoundError(f"Band with ID {band_id} not found")
-
-        # Delete associated memberships first
-        memberships = await self.session.execute(
-            select(BandMembership).where(BandMembership.band_id == band_id)
+        # Memberships are removed by the foreign key ON DELETE CASCADE
+        deleted_id = await self.session.scalar(
+            delete(Band).where(col(Band.id) == band_id).returning(col(Band.id)),
+            execution_options={"synchronize_session": False},
         )
-        for membership in memberships.scalars():
-            await self.session.delete(membership)
-
-        await self.session.delete(band)
-        await self.session.flush()
+        if deleted_id is None:
+            raise NotFoundError(f"Band with ID {band_id} not found")
 
     async def create_musician(self, musician_data: schemas.MusicianCreate) -> Musician:
         """Create a new musician."""
-        musician = Musician(**musician_data.model_dump())
-        self.session.add(musician)
-        await self.session.flush()
-        return musician
+        # Single INSERT ... RETURNING, without going through the unit of work
+        result = await self.session.execute(
+            insert(Musician).values(**musician_data.__dict__).returning(Musician)
+        )
+        return result.scalar_one()
 
     async def get_musician(self, musician_id: int) -> Musician:
         """Get a musician by ID."""
@@ -112,18 +136,18 @@ class MusicService:
         self, skip: int = 0, limit: int = 100, band_id: int | None = None
     ) -> list[Musician]:
         """Get all musicians with optional filtering by band."""
+        query = select(Musician)
         if band_id is not None:
-            # Get musicians that are members of the specified band
-            memberships_result = await self.session.execute(
-                select(BandMembership).where(BandMembership.band_id == band_id)
+            # Get musicians that are members of the specified band. A semi-join
+            # rather than a join: a musician playing several instruments in the
+            # band has several memberships but must be listed once.
+            query = query.where(
+                col(Musician.id).in_(
+                    select(BandMembership.musician_id).where(
+                        BandMembership.band_id == band_id
+                    )
+                )
             )
-            musician_ids = [m.musician_id for m in memberships_result.scalars()]
-            if not musician_ids:
-                return []
-
-            query = select(Musician).where(col(Musician.id).in_(musician_ids))
-        else:
-            query = select(Musician)
 
         query = query.offset(skip).limit(limit)
         result = await self.session.execute(query)
@@ -133,58 +157,58 @@ class MusicService:
         self, musician_id: int, musician_data: schemas.MusicianUpdate
     ) -> Musician:
         """Update a musician."""
+        if not musician_data.model_fields_set:
+            return await self.get_musician(musician_id=musician_id)
+
+        values = _fields_set_values(musician_data)
+
         musician = await self.session.scalar(
-            select(Musician).where(Musician.id == musician_id)
+            update(Musician)
+            .where(col(Musician.id) == musician_id)
+            .values(**values)
+            .returning(Musician),
+            # Refresh the instance if it is already in the identity map
+            execution_options={"synchronize_session": False, "populate_existing": True},
         )
         if not musician:
             raise NotFoundError(f"Musician with ID {musician_id} not found")
-
-        update_data = musician_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(musician, field, value)
-
-        await self.session.flush()
         return musician
 
     async def delete_musician(self, musician_id: int) -> None:
         """Delete a musician and all their band memberships."""
-        musician = await self.session.scalar(
-            select(Musician).where(Musician.id == musician_id)
+        # Memberships are removed by the foreign key ON DELETE CASCADE
+        deleted_id = await self.session.scalar(
+            delete(Musician)
+            .where(col(Musician.id) == musician_id)
+            .returning(col(Musician.id)),
+            execution_options={"synchronize_session": False},
         )
-        if not musician:
+        if deleted_id is None:
             raise NotFoundError(f"Musician with ID {musician_id} not found")
 
-        # Delete associated memberships first
-        memberships = await self.session.execute(
-            select(BandMembership).where(BandMembership.musician_id == musician_id)
-        )
-        for membership in memberships.scalars():
-            await self.session.delete(membership)
-
-        await self.session.delete(musician)
-        await self.session.flush()
-
     async def create_band_membership(
         self, membership_data: schemas.BandMembershipCreate
     ) -> BandMembership:
         """Create a new band membership."""
-        # Validate band exists
-        band = await self.session.scalar(
-            select(Band).where(Band.id == membership_data.band_id)
-        )
-        if not band:
+        # Validate band and musician exist in a single round-trip
+        band_exists, musician_exists = (
+            await self.session.execute(
+                select(
+                    exists().where(col(Band.id) == membership_data.band_id),
+                    exists().where(col(Musician.id) == membership_data.musician_id),
+                )
+            )
+        ).one()
+        if not band_exists:
             raise NotFoundError(f"Band with ID {membership_data.band_id} not found")
-
-        # Validate musician exists
-        musician = await self.session.scalar(
-            select(Musician).where(Musician.id == membership_data.musician_id)
-        )
-        if not musician:
+        if not musician_exists:
             raise NotFoundError(
                 f"Musician with ID {membership_data.musician_id} not found"
             )
 
-        membership = BandMembership(**membership_data.model_dump())
-        self.session.add(membership)
-        await self.session.flush()
-        return membership
+        result = await self.session.execute(
+            insert(BandMembership)
+            .values(**membership_data.__dict__)
+            .returning(BandMembership)
+        )
+        return result.scalar_one()
@@ -0,0 +1,44 @@
+"""Tests for the database initialization command."""
+
+from sqlalchemy import NullPool, create_engine, text
+from sqlalchemy.engine import make_url
+
+from template_app.commands.init_db import (
+    create_databases_if_not_exist,
+    run_migrations_parallel,
+)
+from template_app.core import config
+
+
+def test_run_migrations_parallel():
+    """Test migrating several databases at once, reporting any failure."""
+    test_url = make_url(config.POSTGRESQL_URL_PSYCOPG)
+    maintenance_url = test_url.set(database="postgres")
+    db_names = [f"{test_url.database}_parallel_{i}" for i in range(2)]
+    db_uris = [
+        test_url.set(database=name).render_as_string(hide_password=False)
+        for name in db_names
+    ]
+    missing_db_uri = test_url.set(
+        database=f"{test_url.database}_parallel_missing"
+    ).render_as_string(hide_password=False)
+
+    maintenance_uri = maintenance_url.render_as_string(hide_password=False)
+    try:
+        assert create_databases_if_not_exist(maintenance_uri, db_names)
+        # Already existing databases are skipped
+        assert create_databases_if_not_exist(maintenance_uri, db_names)
+
+        assert run_migrations_parallel(db_uris, workers=2)
+        for db_uri in db_uris:
+            engine = create_engine(db_uri, poolclass=NullPool)
+            with engine.connect() as conn:
+                assert conn.scalar(text("SELECT to_regclass('band')")) is not None
+            engine.dispose()
+        assert not run_migrations_parallel([*db_uris, missing_db_uri], workers=2)
+    finally:
+        engine = create_engine(maintenance_url, poolclass=NullPool)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for name in db_names:
+                conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        engine.dispose()
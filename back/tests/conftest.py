@@ -18,7 +18,7 @@ import pytest
 from faker import Faker
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import NullPool, create_engine, event, text
+from sqlalchemy import NullPool, create_engine, text
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -26,8 +26,8 @@ from template_app.commands.init_db import init_db as init_db_command
 from template_app.core import config
 from template_app.core.database.base import SESSION_OPTIONS
 from template_app.main import create_app, lifespan
-from tests.core.factories.base import SQLModelFaker
-from tests.core.utils.db import increment_query_count
+from tests.core.factories.base import SHARED_FAKER, SQLModelFaker
+from tests.music.factories import register_music_factories
 
 # Mark as pytest environment
 os.environ["IS_PYTEST_RUNNING"] = "true"
@@ -42,13 +42,18 @@ def pytest_configure() -> None:
 
 
 @pytest.fixture(scope="function", autouse=True)
-def cleanup_http_connections():
+def cleanup_http_connections(request):
     """Automatically cleanup HTTP connections after each test."""
     import gc
 
     yield  # Run the test
 
-    gc.collect()
+    # The transports of a test are young objects: only sweep the youngest
+    # generation unless the test asks for a full collection
+    if request.node.get_closest_marker("needs_full_gc") is not None:
+        gc.collect()
+    else:
+        gc.collect(0)
 
 
 def pytest_addoption(parser):
@@ -83,13 +88,11 @@ def _terminate_connections(conn, db_name: str):
 def create_db(request):
     """Fixture that ensures a fresh test database exists, yields its URL, and drops it after."""
 
-    url = config.POSTGRESQL_URL
-    if url.startswith("postgresql://"):
-        url = "postgresql+psycopg://" + url[len("postgresql://") :]
-    db_name = make_url(url).database
-    maintenance_db = make_url(url).set(
-        database="postgres"
-    )  # this db is used to perform the drop / createdb operations
+    url = config.POSTGRESQL_URL_PSYCOPG
+    parsed_url = make_url(url)
+    db_name = parsed_url.database
+    # this db is used to perform the drop / createdb operations
+    maintenance_db = parsed_url.set(database="postgres")
     engine = create_engine(maintenance_db, poolclass=NullPool)
 
     if not db_name or not (db_name.endswith("_test") or db_name.startswith("test_")):
@@ -147,11 +150,6 @@ async def engine(init_db, request):
     verbose = request.config.getoption("verbose") >= 1
     engine = create_async_engine(init_db, future=True, echo=verbose, poolclass=NullPool)
 
-    # Add event listener to count queries
-    @event.listens_for(engine.sync_engine, "before_execute")
-    def count_queries(conn, clauseelement, multiparams, params, execution_options):
-        increment_query_count(clauseelement)
-
     try:
         yield engine
     finally:
@@ -178,10 +176,19 @@ async def use_db(engine):
                 await trans.rollback()
 
 
+@pytest.fixture(scope="session")
+def app_factory() -> FastAPI:
+    """Build the app once: routes and response schemas are the same for every test."""
+    return create_app()
+
+
 @pytest.fixture
-def app(use_db) -> FastAPI:
-    app = create_app()
-    return app
+def app(app_factory, use_db) -> FastAPI:
+    """The shared app, with the db isolated by the ``use_db`` nested transaction.
+
+    Tests that set ``app.dependency_overrides`` must clear them afterwards.
+    """
+    return app_factory
 
 
 @pytest.fixture
@@ -223,7 +230,11 @@ async def factory(db_session) -> AsyncGenerator[SQLModelFaker]:
 
         async def test_something(factory):
             band = await create_band(factory, name="The Beatles")
+
+    Use ``factory.bulk_create(Model, [{...}, ...])`` to insert many rows in a
+    single round-trip when setting up larger fixtures.
     """
     Faker.seed(SESSION_TEST_SEED)
-    faker = Faker()
-    yield SQLModelFaker(faker, db_session)
+    model_faker = SQLModelFaker(SHARED_FAKER, db_session)
+    register_music_factories(model_faker)
+    yield model_faker
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from contextlib import asynccontextmanager
 from datetime import date, datetime
 from enum import StrEnum
+from itertools import count
 from types import UnionType
 from typing import (
     Any,
@@ -16,7 +17,9 @@ from typing import (
 from uuid import uuid4
 
 from faker import Faker
+from pydantic import EmailStr
 from pydantic_core import PydanticUndefined
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
@@ -30,12 +33,17 @@ class UnsetType:
     ```
         def my_function(arg: None | UnsetType = UNSET): ...
     ```
+
+    UNSET is the only instance: compare with ``is UNSET`` (equality is identity).
     """
 
     __slots__ = ()
+    _instance: UnsetType | None = None
 
-    def __eq__(self, value: object, /) -> bool:
-        return value is UnsetType
+    def __new__(cls) -> UnsetType:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __repr__(self) -> str:
         return "UNSET"
@@ -44,6 +52,31 @@ class UnsetType:
 UNSET = UnsetType()
 
 
+def _drop_unset(values: dict[str, Any]) -> dict[str, Any]:
+    """Remove the UNSET values, without copying when there are none."""
+    if any(v is UNSET for v in values.values()):
+        return {k: v for k, v in values.items() if v is not UNSET}
+    return values
+
+
+# Field defaults that mean "no default value"
+_DEFAULT_SENTINELS = frozenset({None, "", PydanticUndefined, ...})
+
+
+def _is_default_sentinel(value: Any) -> bool:
+    try:
+        return value in _DEFAULT_SENTINELS
+    except TypeError:  # unhashable default, e.g. a list
+        return False
+
+
+# Loading faker's providers is slow: share one instance across factories
+SHARED_FAKER = Faker("en_US")
+
+# (generated fields as (name, generator) pairs, names of all the model fields)
+BuildPlan = tuple[tuple[tuple[str, Callable[[], Any]], ...], frozenset[str]]
+
+
 class ModelBuilder(Protocol):
     def build(self, model: type[T], /, **overrides: Any) -> T:
         """Builds an instance of model T."""
@@ -58,15 +91,18 @@ class SQLModelFaker:
     """Auto-generates SQLModel instances with realistic fake values for tests.
 
     Attributes:
-        fake: Faker instance (seedable).
+        fake: Faker instance (seedable), defaults to the shared SHARED_FAKER.
         session: database session or None. If provided, will save objects in db.
         generators: Map of (python_type or field_name) -> callable returning a value.
     """
 
     def __init__(self, fake: Faker | None = None, session: AsyncSession | None = None):
-        self.fake = fake or Faker()
+        self.fake = fake or SHARED_FAKER
         self.session = session
         self._batch_flush_depth = 0  # Track nesting depth of batch_flush contexts
+        self._email_counter = count()
+        # Per-model field generators, resolved on the first build of each model
+        self._plans: dict[type[SQLModel], BuildPlan] = {}
         # type-based generators
         self.generators: dict[Any, Callable[[], Any]] = {
             int: self.fake.pyint,
@@ -77,7 +113,7 @@ class SQLModelFaker:
             date: self.fake.date_object,
         }
         # field-name heuristics for nicer realism
-        self.generators["email"] = self.fake.unique.email
+        self.generators["email"] = self._next_email
         self.generators["name"] = self.fake.name
         self.generators["full_name"] = self.fake.name
         self.generators["country"] = self.fake.country
@@ -86,9 +122,16 @@ class SQLModelFaker:
             self.fake.random_int
         )  # if you want auto ids here (often repo sets id)
 
+    def _next_email(self) -> str:
+        # Unique by construction, unlike fake.unique which tracks every value
+        # it returned and retries on collisions
+        return f"user{next(self._email_counter)}@example.com"
+
     def register(self, key: Any, fn: Callable[[], Any]) -> None:
         """Register or override a generator for a python type or field name."""
         self.generators[key] = fn
+        # Generators are resolved into the cached build plans
+        self._plans.clear()
 
     def _is_optional(self, annotation: Any) -> tuple[bool, Any]:
         origin = get_origin(annotation)
@@ -104,15 +147,11 @@ class SQLModelFaker:
     def _by_type(self, pytype: Any) -> Callable[[], Any] | None:
         if pytype in self.generators:
             return self.generators[pytype]
-        if issubclass(pytype, StrEnum):
+        if pytype is EmailStr:
+            return self._next_email
+        # Annotations such as unions or generics are not classes
+        if isinstance(pytype, type) and issubclass(pytype, StrEnum):
             return lambda: self.fake.enum(pytype)
-        try:
-            from pydantic import EmailStr
-
-            if pytype is EmailStr:
-                return self.fake.unique.email
-        except Exception:
-            pass
 
         return None
 
@@ -126,24 +165,44 @@ class SQLModelFaker:
         Returns:
             model instance.
         """
-        field_map = model.model_fields
-        values: dict[str, Any] = {}
+        return model(**self._build_values(model, **overrides))
 
-        for name, finfo in field_map.items():
-            if name in overrides:
-                values[name] = overrides.pop(name)
-                continue
+    def _build_values(self, model: type[T], /, **overrides: Any) -> dict[str, Any]:
+        plan = self._plans.get(model)
+        if plan is None:
+            plan = self._plans[model] = self._compile_plan(model)
+
+        generated, field_names = plan
+        if not overrides.keys() <= field_names:
+            unknown = [name for name in overrides if name not in field_names]
+            msg = f"unknown attributes for model {model} used in model factory: {','.join(unknown)}"
+            raise RuntimeError(msg)
 
+        values = {
+            name: generate() for name, generate in generated if name not in overrides
+        }
+        values.update(overrides)
+        return values
+
+    def _compile_plan(self, model: type[T]) -> BuildPlan:
+        """Resolve the generator of every field of model once.
+
+        Fields that are left to their default (or to the database) have no
+        generator: they are only set when explicitly overridden.
+        """
+        generated: list[tuple[str, Callable[[], Any]]] = []
+        for name, finfo in model.model_fields.items():
             # Skip if default or default_factory exists
-            default_present = getattr(finfo, "default", None) not in (
-                None,
-                "",
-                PydanticUndefined,
-                ...,
-            )
+            default_present = not _is_default_sentinel(getattr(finfo, "default", None))
             default_factory = getattr(finfo, "default_factory", None)
             if default_present or default_factory is not None:
                 continue
+            # Skip columns filled by the database (e.g. created_at)
+            sa_column_kwargs = getattr(finfo, "sa_column_kwargs", None)
+            if isinstance(sa_column_kwargs, dict) and (
+                "server_default" in sa_column_kwargs
+            ):
+                continue
 
             # Determine annotation/inner type
             annotation = getattr(finfo, "annotation", None) or getattr(
@@ -157,31 +216,25 @@ class SQLModelFaker:
             )
             if not g:
                 # Try by python type
-                pytype = getattr(finfo, "annotation", None) or getattr(
-                    finfo, "type_", None
-                )
-                g = self._by_type(inner or pytype)
+                g = self._by_type(inner or annotation)
             if not g:
                 # Try by faker name
                 if hasattr(self.fake, name):
                     g = getattr(self.fake, name)
-            if g:
-                values[name] = g()
-            else:
+            if not g:
                 # last resort: a stable fake string
-                values[name] = f"{name}-{self.fake.pystr(min_chars=6, max_chars=10)}"
-
-        if len(overrides):
-            msg = f"unknown attributes for model {model} used in model factory: {','.join(overrides)}"
-            raise RuntimeError(msg)
+                g = self._fallback_generator(name)
+            generated.append((name, g))
+        return tuple(generated), frozenset(model.model_fields)
 
-        return model(**values)  # type: ignore[arg-type]
+    def _fallback_generator(self, name: str) -> Callable[[], Any]:
+        return lambda: f"{name}-{self.fake.pystr(min_chars=6, max_chars=10)}"
 
     @asynccontextmanager
     async def batch_flush(self):
         """Context manager to batch multiple create operations with a single flush.
 
-        When used, disables individual flushes in create/create_multiple methods
+        When used, disables individual flushes in the create method
         and performs a single flush when the context exits.
 
         Supports nesting - only the outermost context manager will perform the flush.
@@ -219,7 +272,7 @@ class SQLModelFaker:
         Returns:
             Persisted model instance with database-generated fields populated
         """
-        overrides = {k: v for k, v in overrides.items() if v is not UNSET}
+        overrides = _drop_unset(overrides)
         instance = self.build(model, **overrides)
         if self.session is not None:
             self.session.add(instance)
@@ -241,16 +294,27 @@ class SQLModelFaker:
         Returns:
             List of persisted model instances
         """
-        shared_overrides = {k: v for k, v in shared_overrides.items() if v is not UNSET}
-        instances = []
-        for _ in range(count):
-            instance = self.build(model, **shared_overrides)
-            instances.append(instance)
-            if self.session:
-                self.session.add(instance)
-
-        # Only flush if not in batch mode
-        if self.session and self._batch_flush_depth == 0:
-            await self.session.flush()
-
-        return instances
+        # Persisted with a single executemany INSERT ... RETURNING
+        return await self.bulk_create(model, [shared_overrides] * count)
+
+    async def bulk_create(self, model: type[T], rows: list[dict[str, Any]]) -> list[T]:
+        """Create one instance per row with a single INSERT ... RETURNING.
+
+        Each row can carry its own overrides. The rows are sent as one
+        executemany instead of going through the unit of work.
+
+        Args:
+            model: SQLModel subclass to create
+            rows: Field values to override, one dict per instance
+
+        Returns:
+            List of persisted model instances, in the order of rows
+        """
+        values = [self._build_values(model, **_drop_unset(row)) for row in rows]
+        if self.session is None or not values:
+            return [model(**row_values) for row_values in values]
+
+        result = await self.session.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True), values
+        )
+        return list(result.all())
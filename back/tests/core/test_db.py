@@ -1,7 +1,14 @@
-import subprocess
+from types import SimpleNamespace
 
+import alembic.command
+import pytest
+from alembic.util.exc import AutogenerateDiffsDetected
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from template_app.commands.init_db import get_alembic_config
+from template_app.core import config
+from template_app.core.database import escape_like
+
 try:
     from alembic.env import include_object  # type: ignore
 except Exception:
@@ -9,11 +16,41 @@ except Exception:
 
 
 def test_models_match_database(db_session: AsyncSession):
-    result = subprocess.run(
-        ["alembic", "-x", "check-models=1", "check"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, (
-        f"\n# stdout {'#' * 81}\n{result.stdout}\n# stderr {'#' * 81}\n{result.stderr}"
-    )
+    # Run in-process: no interpreter start-up nor re-import of the models
+    try:
+        alembic.command.check(get_alembic_config(config.POSTGRESQL_URL_PSYCOPG))
+    except AutogenerateDiffsDetected as e:
+        pytest.fail(str(e))
+
+
+async def test_get_session_reuses_read_sessions(use_db):
+    from template_app.core.database import base
+
+    get_request = SimpleNamespace(method="GET")
+
+    async def open_session(request) -> AsyncSession:
+        gen = base.get_session(request)
+        session = await anext(gen)
+        await gen.aclose()
+        return session
+
+    await base.init_db_connections()
+    try:
+        first = await open_session(get_request)
+        others = [
+            await open_session(get_request) for _ in range(base.SESSION_POOL_SIZE - 1)
+        ]
+        assert first not in others
+        # the first session went back to the end of the queue
+        assert await open_session(get_request) is first
+        # write requests never use the pool
+        post_session = await open_session(SimpleNamespace(method="POST"))
+        assert post_session is not first
+        assert post_session not in others
+    finally:
+        await base.close_db_connections()
+
+
+def test_escape_like():
+    assert escape_like("100%_done\\") == "100\\%\\_done\\\\"
+    assert escape_like("plain") == "plain"
@@ -4,54 +4,73 @@ import re
 from contextlib import contextmanager
 from threading import local
 
-# Thread-local storage for query counting
-_query_counter = local()
-
+from sqlalchemy import Engine, event
 
-def _get_query_count():
-    """Get current query count for this thread."""
-    return getattr(_query_counter, "count", 0)
+# Thread-local storage for query counting: the count is len(queries), a single
+# list.append per statement instead of a separate counter to keep in sync
+_query_counter = local()
 
 
-def _get_executed_queries():
+def _get_executed_queries() -> list[str]:
     """Get list of executed queries for this thread."""
     return getattr(_query_counter, "queries", [])
 
 
+def _get_query_count():
+    """Get current query count for this thread."""
+    return len(_get_executed_queries())
+
+
 def _reset_query_count():
-    """Reset query count and query list for this thread."""
-    _query_counter.count = 0
+    """Reset the query list for this thread."""
     _query_counter.queries = []
 
 
 def _remove_test_savepoints():
     """Removes first and last queries that are related to the test savepoint generated by begin_nested."""
     savepoint_pattern = r"^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\s+sa_savepoint_\d+\s*$"
-    cleaned_queries = []
-    for query in _query_counter.queries:
-        if bool(re.match(savepoint_pattern, query.strip(), re.IGNORECASE)):
-            continue
-        cleaned_queries.append(query)
-    _query_counter.count = len(cleaned_queries)
-    _query_counter.queries = cleaned_queries
+    _query_counter.queries = [
+        query
+        for query in _get_executed_queries()
+        if not re.match(savepoint_pattern, query.strip(), re.IGNORECASE)
+    ]
 
 
 def increment_query_count(query_text=None):
-    """Increment query count and store query text for this thread."""
-    if not hasattr(_query_counter, "count"):
-        _query_counter.count = 0
-        _query_counter.queries = []
+    """Record a query for this thread; the count is the number of recorded queries."""
+    queries = getattr(_query_counter, "queries", None)
+    if queries is None:
+        queries = _query_counter.queries = []
 
-    if query_text is not None:
-        query_str = str(query_text)
+    if query_text is None:
+        queries.append("<unknown query>")
+        return
 
-        # Store first 100 chars of the query
-        truncated_query = query_str[:100]
-        if len(query_str) > 100:
-            truncated_query += "..."
-        _query_counter.queries.append(truncated_query)
+    # Store first 100 chars of the query
+    query_str = str(query_text)
+    truncated_query = query_str[:100]
+    if len(query_str) > 100:
+        truncated_query += "..."
+    queries.append(truncated_query)
 
-    _query_counter.count += 1
+
+def _count_query(conn, clauseelement, multiparams, params, execution_options):
+    increment_query_count(clauseelement)
+
+
+@contextmanager
+def count_queries():
+    """Count the queries executed by any engine while the block runs.
+
+    The listener is only installed for the duration of the block so that
+    statements outside of it don't pay for the counting callback.
+    """
+    _reset_query_count()
+    event.listen(Engine, "before_execute", _count_query)
+    try:
+        yield
+    finally:
+        event.remove(Engine, "before_execute", _count_query)
 
 
 @contextmanager
@@ -68,8 +87,8 @@ def assert_num_queries(expected_count, ignore_test_savepoints: bool = True):
             user = factory.create(User)
             user.save()
     """
-    _reset_query_count()
-    yield
+    with count_queries():
+        yield
 
     if ignore_test_savepoints:
         _remove_test_savepoints()
@@ -16,20 +16,32 @@ logger = logging.getLogger(__name__)
 
 MusicianWithInstrument = tuple[Musician, MusicInstrument]
 
+# Picked with the seeded faker random directly: fake.enum / random_choices
+# go through faker's generic element selection on every call
+_GENRES = tuple(MusicGenre)
+_INSTRUMENTS = tuple(MusicInstrument)
+
+
+def register_music_factories(factory: SQLModelFaker) -> None:
+    """Register the music field generators, once per factory."""
+    factory.register("Band.name", factory.fake.company)
+    factory.register("Band.genre", lambda: factory.fake.random.choice(_GENRES))
+    factory.register(
+        "Band.formed_year", lambda: factory.fake.random.randint(1960, 2020)
+    )
+
 
 async def associate_musicians_to_band(
-    factory, band: Band, musicians: list[MusicianWithInstrument]
+    factory: SQLModelFaker, band: Band, musicians: list[MusicianWithInstrument]
 ) -> list[BandMembership]:
-    memberships = []
-    for musician, instrument in musicians:
-        link = await factory.create(
-            BandMembership,
-            band_id=band.id,
-            musician_id=musician.id,
-            instrument=instrument,
-        )
-        memberships.append(link)
-    return memberships
+    # A single executemany INSERT for all the memberships of the band
+    return await factory.bulk_create(
+        BandMembership,
+        [
+            {"band_id": band.id, "musician_id": musician.id, "instrument": instrument}
+            for musician, instrument in musicians
+        ],
+    )
 
 
 async def create_band(
@@ -39,20 +51,13 @@ async def create_band(
     musicians: list[MusicianWithInstrument] | UnsetType = UNSET,
 ) -> Band:
     """Create a test band with realistic data."""
-    factory.register("Band.name", factory.fake.company)
-    factory.register(
-        "Band.formed_year", lambda: factory.fake.random_int(min=1960, max=2020)
-    )
 
     async def _create_musicians_with_instruments(
         n: int,
     ) -> list[tuple[Musician, MusicInstrument]]:
-        musicians: list[Musician] = []
-        for _ in range(n):
-            musician = await create_musician(factory)
-            musicians.append(musician)
-        instruments = factory.fake.random_choices(MusicInstrument, length=n)
-        return list(zip(musicians, instruments, strict=True))
+        musicians = await factory.create_multiple(Musician, n)
+        choice = factory.fake.random.choice
+        return [(musician, choice(_INSTRUMENTS)) for musician in musicians]
 
     async with factory.batch_flush():
         band = await factory.create(Band, name=name, genre=genre)
@@ -80,7 +85,7 @@ async def create_musician(
         instrument_value = (
             instrument
             if instrument is not UNSET
-            else factory.fake.enum(MusicInstrument)
+            else factory.fake.random.choice(_INSTRUMENTS)
         )
         await factory.create(
             BandMembership,
@@ -1,9 +1,18 @@
 """Tests for music domain models."""
 
+from typing import get_args
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from template_app.music.models import BandMembership, MusicGenre, MusicInstrument
+from template_app.music import schemas
+from template_app.music.models import (
+    BandMembership,
+    MusicGenre,
+    Musician,
+    MusicInstrument,
+)
 from tests.core.factories.base import SQLModelFaker
+from tests.core.utils.db import assert_num_queries
 from tests.music.factories import create_band, create_musician
 
 
@@ -47,3 +56,32 @@ async def test_band_musician_relationship(
     memberships: list[BandMembership] = await band.awaitable_attrs.memberships
     assert len(memberships) == 1
     assert memberships[0].musician_id == musician.id
+
+
+async def test_bulk_create_musicians(factory: SQLModelFaker):
+    """Test that bulk_create inserts all rows in a single statement."""
+    names = ["John Lennon", "Paul McCartney", "George Harrison"]
+
+    with assert_num_queries(1):
+        musicians = await factory.bulk_create(
+            Musician, [{"name": name} for name in names]
+        )
+
+    assert [musician.name for musician in musicians] == names
+    assert all(musician.id is not None for musician in musicians)
+    assert all(musician.created_at is not None for musician in musicians)
+
+
+async def test_create_multiple_musicians(factory: SQLModelFaker):
+    """Test that create_multiple persists all instances in a single statement."""
+    with assert_num_queries(1):
+        musicians = await factory.create_multiple(Musician, 5, name="Session Player")
+
+    assert len({musician.id for musician in musicians}) == 5
+    assert all(musician.name == "Session Player" for musician in musicians)
+
+
+def test_schema_literals_match_enums():
+    """Test that the schema Literal types stay in sync with the model enums."""
+    assert get_args(schemas.MusicGenreLiteral) == tuple(MusicGenre)
+    assert get_args(schemas.MusicInstrumentLiteral) == tuple(MusicInstrument)
@@ -2,7 +2,7 @@
 
 from httpx import AsyncClient
 
-from template_app.music.models import MusicGenre
+from template_app.music.models import BandMembership, MusicGenre
 from tests.core.factories.base import SQLModelFaker
 from tests.core.utils.db import assert_num_queries
 from tests.music.factories import create_band, create_musician
@@ -106,7 +106,10 @@ async def test_update_band(http_client: AsyncClient, factory: SQLModelFaker):
     band = await create_band(factory, name="The Beatles", genre=MusicGenre.ROCK)
 
     update_data = {"genre": "POP"}
-    response = await http_client.patch(f"/api/music/bands/{band.id}", json=update_data)
+    with assert_num_queries(2):
+        response = await http_client.patch(
+            f"/api/music/bands/{band.id}", json=update_data
+        )
     assert response.status_code == 200
 
     data = response.json()
@@ -114,11 +117,26 @@ async def test_update_band(http_client: AsyncClient, factory: SQLModelFaker):
     assert data["name"] == "The Beatles"  # unchanged
 
 
+async def test_update_band_without_changes(
+    http_client: AsyncClient, factory: SQLModelFaker
+):
+    """Test that an empty patch returns the band without updating it."""
+    band = await create_band(factory, name="The Beatles", genre=MusicGenre.ROCK)
+
+    # Band select + memberships selectin load, no UPDATE
+    with assert_num_queries(2):
+        response = await http_client.patch(f"/api/music/bands/{band.id}", json={})
+    assert response.status_code == 200
+    assert response.json()["name"] == "The Beatles"
+
+
 async def test_delete_band(http_client: AsyncClient, factory: SQLModelFaker):
     """Test deleting a band."""
     band = await create_band(factory, name="The Beatles")
+    assert band.memberships
 
-    response = await http_client.delete(f"/api/music/bands/{band.id}")
+    with assert_num_queries(1):
+        response = await http_client.delete(f"/api/music/bands/{band.id}")
     assert response.status_code == 200
 
     # Verify it's gone
@@ -140,6 +158,45 @@ async def test_create_musician(http_client: AsyncClient, factory: SQLModelFaker)
     assert "id" in data
 
 
+async def test_update_musician(http_client: AsyncClient, factory: SQLModelFaker):
+    """Test updating a musician."""
+    musician = await create_musician(factory, name="John Lennon")
+
+    with assert_num_queries(1):
+        response = await http_client.patch(
+            f"/api/music/musicians/{musician.id}",
+            json={"name": "John Winston Lennon"},
+        )
+    assert response.status_code == 200
+    assert response.json()["name"] == "John Winston Lennon"
+
+    response = await http_client.patch(
+        "/api/music/musicians/999999", json={"name": "Nobody"}
+    )
+    assert response.status_code == 404
+
+    response = await http_client.get(f"/api/music/musicians/{musician.id}")
+    assert response.json()["name"] == "John Winston Lennon"
+
+
+async def test_delete_musician(http_client: AsyncClient, factory: SQLModelFaker):
+    """Test deleting a musician also removes their band memberships."""
+    band = await create_band(factory, name="The Beatles")
+    musician = band.memberships[0].musician
+
+    with assert_num_queries(1):
+        response = await http_client.delete(f"/api/music/musicians/{musician.id}")
+    assert response.status_code == 200
+
+    response = await http_client.delete(f"/api/music/musicians/{musician.id}")
+    assert response.status_code == 404
+
+    response = await http_client.get(f"/api/music/bands/{band.id}")
+    members = response.json()["members"]
+    assert len(members) == len(band.memberships) - 1
+    assert musician.id not in [member["musician"]["id"] for member in members]
+
+
 async def test_get_musicians_by_band(http_client: AsyncClient, factory: SQLModelFaker):
     """Test filtering musicians by band."""
     from template_app.music.models import MusicInstrument
@@ -148,23 +205,31 @@ async def test_get_musicians_by_band(http_client: AsyncClient, factory: SQLModel
     band2 = await create_band(factory, name="Led Zeppelin", musicians=[])
 
     # Create musicians and their band memberships
-    await create_musician(
+    john = await create_musician(
         factory, name="John Lennon", band=band1, instrument=MusicInstrument.GUITAR
     )
     await create_musician(
         factory, name="Paul McCartney", band=band1, instrument=MusicInstrument.BASS
     )
+    # A second instrument in the same band must not list the musician twice
+    await factory.create(
+        BandMembership,
+        band_id=band1.id,
+        musician_id=john.id,
+        instrument=MusicInstrument.VOCALS,
+    )
     await create_musician(
         factory, name="Robert Plant", band=band2, instrument=MusicInstrument.VOCALS
     )
 
-    response = await http_client.get(f"/api/music/musicians?band_id={band1.id}")
+    with assert_num_queries(1):
+        response = await http_client.get(f"/api/music/musicians?band_id={band1.id}")
     assert response.status_code == 200
 
     data = response.json()
     assert len(data) == 2
     musician_names = [musician["name"] for musician in data]
-    assert "John Lennon" in musician_names
+    assert musician_names.count("John Lennon") == 1
     assert "Paul McCartney" in musician_names
     assert "Robert Plant" not in musician_names
 
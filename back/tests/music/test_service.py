@@ -0,0 +1,88 @@
+"""Tests for the music domain service layer."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from template_app.core.exceptions import NotFoundError
+from template_app.music import schemas
+from template_app.music.service import MusicService
+from tests.core.factories.base import SQLModelFaker
+from tests.core.utils.db import assert_num_queries
+from tests.music.factories import create_band, create_musician
+
+
+async def test_create_band_membership(factory: SQLModelFaker, db_session: AsyncSession):
+    """Test adding a musician to a band."""
+    band = await create_band(factory, name="The Beatles", musicians=[])
+    musician = await create_musician(factory, name="John Lennon")
+    service = MusicService(db_session)
+
+    with assert_num_queries(2):
+        membership = await service.create_band_membership(
+            schemas.BandMembershipCreate(
+                band_id=band.id,  # type: ignore[arg-type]
+                musician_id=musician.id,  # type: ignore[arg-type]
+                instrument="GUITAR",
+            )
+        )
+
+    assert membership.band_id == band.id
+    assert membership.musician_id == musician.id
+
+
+async def test_create_band_membership_not_found(
+    factory: SQLModelFaker, db_session: AsyncSession
+):
+    """Test that a missing band or musician raises a not found error."""
+    band = await create_band(factory, name="The Beatles", musicians=[])
+    musician = await create_musician(factory, name="John Lennon")
+    service = MusicService(db_session)
+
+    with pytest.raises(NotFoundError, match="Band with ID 999999 not found"):
+        await service.create_band_membership(
+            schemas.BandMembershipCreate(
+                band_id=999999,
+                musician_id=musician.id,  # type: ignore[arg-type]
+                instrument="GUITAR",
+            )
+        )
+    with pytest.raises(NotFoundError, match="Musician with ID 999999 not found"):
+        await service.create_band_membership(
+            schemas.BandMembershipCreate(
+                band_id=band.id,  # type: ignore[arg-type]
+                musician_id=999999,
+                instrument="GUITAR",
+            )
+        )
+
+
+async def test_update_band_refreshes_loaded_instance(
+    factory: SQLModelFaker, db_session: AsyncSession
+):
+    """Test that updating a band already in the session returns the new values."""
+    band = await create_band(factory, name="Stale", musicians=[])
+    service = MusicService(db_session)
+
+    updated = await service.update_band(
+        band.id,  # type: ignore[arg-type]
+        schemas.BandUpdate(name="Fresh"),
+    )
+
+    assert updated is band
+    assert updated.name == "Fresh"
+
+
+async def test_update_musician_refreshes_loaded_instance(
+    factory: SQLModelFaker, db_session: AsyncSession
+):
+    """Test that updating a musician already in the session returns the new values."""
+    musician = await create_musician(factory, name="Stale")
+    service = MusicService(db_session)
+
+    updated = await service.update_musician(
+        musician.id,  # type: ignore[arg-type]
+        schemas.MusicianUpdate(name="Fresh"),
+    )
+
+    assert updated is musician
+    assert updated.name == "Fresh"